@@ -19,6 +19,7 @@ The factory pattern allows for:
 
 Author: Anslem Akadu
 """
+import logging
 import os
 from flask import Flask
 
@@ -39,7 +40,13 @@ def create_app():
         >>> app.run()
     """
     app = Flask(__name__)
-    
+
+    # Logging Configuration
+    # INFO in production keeps the per-request debug logs (and their
+    # expensive reprs) disabled; set FLASK_ENV=development to see them
+    log_level = logging.DEBUG if os.getenv("FLASK_ENV") == "development" else logging.INFO
+    logging.basicConfig(level=log_level)
+
     # Security Configuration
     # In production, SECRET_KEY must be set as an environment variable
     app.secret_key = os.getenv('SECRET_KEY', 'dev-key-change-in-prod')
@@ -0,0 +1,52 @@
+"""
+Shared JSON Helpers
+
+Thin wrapper that routes JSON decoding through orjson (a native
+implementation several times faster than the stdlib) when it is
+installed, with a transparent stdlib fallback. All resource-file
+loading in the app goes through load_file so the fast path is applied
+consistently.
+
+Author: Anslem Akadu
+"""
+
+import mmap
+
+try:
+    import orjson
+
+    def loads(data):
+        """Parse JSON from a str or bytes value."""
+        return orjson.loads(data)
+
+    def load_file(path: str):
+        """
+        Load and parse a JSON file.
+
+        The file is mapped read-only with mmap and handed to orjson as a
+        memoryview (orjson rejects mmap objects themselves), so the
+        kernel page cache backs the parse without an intermediate Python
+        read buffer. Empty files can't be mapped and fall back to a
+        plain read (json.loads('') raises either way).
+        """
+        with open(path, 'rb') as f:
+            try:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # Zero-length file: mmap refuses it; parse the plain read
+                # so the decode error, if any, still comes from orjson
+                return orjson.loads(f.read())
+            with mm:
+                return orjson.loads(memoryview(mm))
+
+except ImportError:
+    import json
+
+    def loads(data):
+        """Parse JSON from a str or bytes value."""
+        return json.loads(data)
+
+    def load_file(path: str):
+        """Load and parse a JSON file."""
+        with open(path, 'r') as f:
+            return json.load(f)
@@ -21,50 +21,83 @@ Technical Implementation:
 Author: Anslem Akadu
 """
 
+import functools
+import hashlib
 import os
-import re 
-import json
+import re
 from typing import List, Optional
 import difflib
-from sentence_transformers import SentenceTransformer, util
+
+from app.resources import ALL_SKILLS as _SHARED_SKILLS
+
+# sentence_transformers (and torch underneath it) are imported lazily in
+# _ensure_embedder so worker boot doesn't pay the heavy ML import cost.
 
 # Constants for skill matching
 EMBEDDING_MODEL = 'all-MiniLM-L6-v2'
 COSINE_THRESHOLD = 0.70
 FALLBACK_THRESHOLD = 0.80
 
+# On-disk cache for precomputed skill embeddings, keyed by a hash of the
+# skill list so edits to skills_matrix.json invalidate stale entries
+EMBEDDING_CACHE_DIR = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), '..', 'resources', '.embedding_cache')
+)
+
 def load_skills() -> List[str]:
     """
     Load and normalize skills from the skills matrix configuration file.
     
     Returns:
         List[str]: Sorted list of unique, normalized skill names
-        
+
     Technical Details:
-        - Skills are loaded from skills_matrix.json
-        - All skills are converted to lowercase for consistency
-        - Duplicates are removed using set operations
-        
+        - Skills come from the shared app.resources module, which parses
+          skills_matrix.json exactly once per process
+        - All skills are lowercased and deduplicated at load time
+
     Example:
         >>> skills = load_skills()
         >>> print(skills[:3])
         ['aws', 'azure', 'bash']
     """
-    try:
-        base_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
-        skills_path = os.path.join(base_path, 'resources', 'skills_matrix.json')
-        if not os.path.exists(skills_path):
-            raise FileNotFoundError(f"skills_matrix.json not found at {skills_path}")
-        with open(skills_path, 'r') as f:
-            skills_data = json.load(f)
-        return sorted({skill.lower() for skills in skills_data.values() for skill in skills})
-    except Exception as e:
-        print(f"Error loading skills: {e}")
-        return []
+    return sorted(_SHARED_SKILLS)
 
 # Initialize global skill list
 ALL_KNOWN_SKILLS = load_skills()
 
+try:
+    from rapidfuzz import process as _rf_process, fuzz as _rf_fuzz
+except ImportError:
+    # rapidfuzz (C++ scorer) is preferred; difflib remains the last resort
+    _rf_process = None
+    _rf_fuzz = None
+
+# Immutable tuple view for the rapidfuzz scorer
+_SKILLS_TUPLE = tuple(ALL_KNOWN_SKILLS)
+
+# Prefilter tables: most resume words ("the", "experienced", ...) can never
+# match a skill, so they are dropped before they reach the embedding batch.
+_STOPWORDS = frozenset({
+    "the", "and", "a", "an", "of", "in", "to", "for", "with", "on", "at",
+    "by", "from", "as", "is", "are", "was", "were", "be", "been", "being",
+    "have", "has", "had", "do", "does", "did", "will", "would", "can",
+    "could", "should", "may", "might", "i", "my", "me", "we", "our", "you",
+    "your", "it", "its", "this", "that", "these", "those", "or", "not",
+    "but", "all", "new", "using", "used", "use", "work", "worked", "working",
+    "experience", "experienced", "years", "year", "team", "teams", "strong",
+    "skills", "skill", "knowledge", "proficient", "expert", "including",
+})
+_SKILL_PREFIXES = frozenset(s[:3] for s in ALL_KNOWN_SKILLS)
+
+def _is_candidate(gram: str) -> bool:
+    """Cheap prefilter applied before a gram enters the embedding batch."""
+    return (
+        len(gram) >= 2
+        and gram not in _STOPWORDS
+        and gram[:3] in _SKILL_PREFIXES
+    )
+
 def clean_text(text: str) -> str:
     """
     Normalize text by removing special characters and converting to lowercase.
@@ -93,15 +126,25 @@ def extract_words(text: str) -> List[str]:
 _embedder = None
 _skill_embeddings = None
 
+def _skill_embedding_cache_path() -> str:
+    """Build the cache file path for the current skill list."""
+    skills_hash = hashlib.sha256("\0".join(ALL_KNOWN_SKILLS).encode()).hexdigest()[:16]
+    return os.path.join(EMBEDDING_CACHE_DIR, f"skills_{skills_hash}.pt")
+
 def _ensure_embedder() -> bool:
     """
     Initialize the sentence transformer model and cache embeddings.
-    
+
     This function implements a lazy loading pattern for the ML model to:
     1. Reduce startup time
     2. Handle cases where the model isn't available
     3. Cache embeddings for better performance
-    
+
+    The encoder is dynamically quantized to int8 (the model is memory-
+    bandwidth bound on CPU), and the precomputed skill embeddings are
+    persisted to disk so subsequent worker boots load them instead of
+    re-encoding the whole skill list.
+
     Returns:
         bool: True if model loaded successfully, False for fallback mode
     """
@@ -109,11 +152,34 @@ def _ensure_embedder() -> bool:
     if _embedder is not None:
         return True
     try:
-        # Load the ML model for semantic matching
+        import torch
+        from sentence_transformers import SentenceTransformer
+
+        # Avoid thread oversubscription when running multiple workers
+        torch.set_num_threads(min(4, os.cpu_count() or 1))
+
+        # Load the ML model and quantize linear layers to int8
         _embedder = SentenceTransformer(EMBEDDING_MODEL)
-        # Pre-compute embeddings for all known skills
-        _skill_embeddings = _embedder.encode(ALL_KNOWN_SKILLS, convert_to_tensor=True)
-        _embedder._util = __import__("sentence_transformers.util", fromlist=["util"])
+        _embedder = torch.quantization.quantize_dynamic(
+            _embedder, {torch.nn.Linear}, dtype=torch.qint8
+        )
+
+        # Load cached skill embeddings if available, else encode and persist
+        cache_path = _skill_embedding_cache_path()
+        if os.path.exists(cache_path):
+            _skill_embeddings = torch.load(cache_path, map_location='cpu')
+        else:
+            _skill_embeddings = _embedder.encode(ALL_KNOWN_SKILLS, convert_to_tensor=True)
+            try:
+                os.makedirs(EMBEDDING_CACHE_DIR, exist_ok=True)
+                torch.save(_skill_embeddings, cache_path)
+            except OSError as e:
+                # Cache is best-effort; a read-only filesystem is not fatal
+                print(f"[nlp_utils] Could not persist skill embeddings: {e}")
+
+        # Normalize once: with unit-length rows, cosine similarity against
+        # the skill matrix reduces to a single matrix multiply per query
+        _skill_embeddings = torch.nn.functional.normalize(_skill_embeddings, dim=1)
         return True
     except Exception as e:
         print(f"[nlp_utils] Embedding model unavailable, falling back to fuzzy string match: {e}")
@@ -121,13 +187,18 @@ def _ensure_embedder() -> bool:
         _skill_embeddings = None
         return False
 
+@functools.lru_cache(maxsize=1024)
 def embed_fuzzy_match(input_skill: str, threshold: float = COSINE_THRESHOLD) -> Optional[str]:
     """
     Match input text to known skills using ML embeddings or fuzzy string matching.
-    
+
     This function uses two approaches:
     1. Primary: Semantic matching using sentence transformers
     2. Fallback: String similarity using difflib
+
+    Results are memoized with an LRU cache: the match for a given token is
+    deterministic given the loaded skill list, and resumes repeat the same
+    tokens constantly, so cache hits skip the model encode entirely.
     
     Args:
         input_skill: Text to match against known skills
@@ -148,17 +219,26 @@ def embed_fuzzy_match(input_skill: str, threshold: float = COSINE_THRESHOLD) ->
         
     # Try ML-based matching first
     if _ensure_embedder():
-        util = _embedder._util
-        input_emb = _embedder.encode(s, convert_to_tensor=True)
-        # Use cosine similarity to find best match
-        cosine_scores = util.pytorch_cos_sim(input_emb, _skill_embeddings)[0]
         import torch
+        input_emb = torch.nn.functional.normalize(
+            _embedder.encode(s, convert_to_tensor=True).unsqueeze(0), dim=1
+        )
+        # Skill embeddings are pre-normalized, so cosine is a plain matmul
+        cosine_scores = (input_emb @ _skill_embeddings.T).squeeze(0)
         best_score, best_idx = torch.max(cosine_scores, dim=0)
         if float(best_score) >= threshold:
             return ALL_KNOWN_SKILLS[int(best_idx)]
         return None
         
-    # Fallback to string similarity if ML model unavailable
+    # Fallback to string similarity if ML model unavailable. rapidfuzz runs
+    # the scorer loop in native code; difflib rescans every skill in Python.
+    if _rf_process is not None:
+        match = _rf_process.extractOne(
+            s, _SKILLS_TUPLE, scorer=_rf_fuzz.WRatio,
+            score_cutoff=FALLBACK_THRESHOLD * 100
+        )
+        return match[0] if match else None
+
     candidates = difflib.get_close_matches(s, ALL_KNOWN_SKILLS, n=1, cutoff=FALLBACK_THRESHOLD)
     return candidates[0] if candidates else None
 
@@ -176,13 +256,49 @@ def extract_skills_from_text(text: str) -> List[str]:
         >>> text = "Expert in Python and JavaScript, learning React"
         >>> extract_skills_from_text(text)
         ['javascript', 'python', 'react']
+
+    Technical Details:
+        Candidate phrases are 1-, 2- and 3-grams over the cleaned token
+        stream, so multi-word skills like "machine learning" can match —
+        single words alone never could. All unique grams are encoded in
+        one batched model call and compared against the cached skill
+        embeddings with a single matrix multiply, which amortizes
+        tokenizer and model-dispatch overhead across the batch.
     """
-    matched = set()
-    for w in extract_words(text):
-        m = embed_fuzzy_match(w)
-        if m:
-            matched.add(m)
-    return sorted(list(matched))
+    tokens = extract_words(text)
+    if not tokens:
+        return []
+
+    # Sliding-window n-grams (n = 1..3) over the token stream
+    grams = set()
+    for n in (1, 2, 3):
+        grams.update(
+            ' '.join(tokens[i:i + n]) for i in range(len(tokens) - n + 1)
+        )
+    # Prefilter: drop stopwords and grams that can't share a prefix with any
+    # known skill — typically 5-20x fewer candidates reach the encoder.
+    grams = sorted(g for g in grams if len(g) <= 40 and _is_candidate(g))
+    if not grams:
+        return []
+
+    if _ensure_embedder():
+        import torch
+        # One batched encode for every unique candidate gram
+        gram_embeddings = torch.nn.functional.normalize(
+            _embedder.encode(
+                grams, convert_to_tensor=True, batch_size=128, show_progress_bar=False
+            ),
+            dim=1,
+        )
+        # Single (n_grams, n_skills) similarity matmul on unit vectors
+        cosine_scores = gram_embeddings @ _skill_embeddings.T
+        best_scores, best_idx = torch.max(cosine_scores, dim=1)
+        # Vectorized threshold mask, then one bulk set construction
+        matched_indices = best_idx[best_scores >= COSINE_THRESHOLD].tolist()
+        return sorted({ALL_KNOWN_SKILLS[i] for i in matched_indices})
+
+    # Fallback: per-gram fuzzy string matching when the model is unavailable
+    return sorted({m for m in map(embed_fuzzy_match, grams) if m})
 
 def clean_manual_input(skills_str: str) -> List[str]:
     """
@@ -197,14 +313,31 @@ def clean_manual_input(skills_str: str) -> List[str]:
     Example:
         >>> clean_manual_input("Python, javascript, ReactJS")
         ['javascript', 'python', 'react']
+
+    Technical Details:
+        All entries are encoded in one batched model call (mirroring
+        extract_skills_from_text) and matches are gathered with a single
+        vectorized threshold mask instead of per-entry set inserts.
     """
-    raw = [t.strip().lower() for t in skills_str.split(",") if t.strip()]
-    out = set()
-    for s in raw:
-        m = embed_fuzzy_match(s)
-        if m:
-            out.add(m)
-    return sorted(list(out))
+    raw = sorted({t.strip().lower() for t in skills_str.split(",") if t.strip()})
+    if not raw:
+        return []
+
+    if _ensure_embedder():
+        import torch
+        entry_embeddings = torch.nn.functional.normalize(
+            _embedder.encode(
+                raw, convert_to_tensor=True, batch_size=64, show_progress_bar=False
+            ),
+            dim=1,
+        )
+        cosine_scores = entry_embeddings @ _skill_embeddings.T
+        best_scores, best_idx = torch.max(cosine_scores, dim=1)
+        matched_indices = best_idx[best_scores >= COSINE_THRESHOLD].tolist()
+        return sorted({ALL_KNOWN_SKILLS[i] for i in matched_indices})
+
+    # Fallback: per-entry fuzzy string matching when the model is unavailable
+    return sorted({m for m in map(embed_fuzzy_match, raw) if m})
 
 # TODO: Future Improvements
 # 1. Add support for skill variations (e.g., "JS" -> "JavaScript")
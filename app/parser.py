@@ -21,65 +21,75 @@ Technical Implementation:
 Author: Anslem Akadu
 """
 
-import json
+import functools
+import hashlib
 import os
 import re
 from typing import Dict, List, Set, Optional
 
-# File paths for skill and role definitions
-# These files form our knowledge base for skill extraction
-RESOURCES_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'resources'))
-SKILLS_MATRIX_PATH = os.path.join(RESOURCES_DIR, 'skills_matrix.json')
+from app._json import load_file as _load_json_file
+from app.resources import ALL_SKILLS, RESOURCES_DIR
+
+# Path for role definitions (the skills matrix itself is parsed once in
+# app.resources and shared by every module that needs it)
 ROLES_PATH = os.path.join(RESOURCES_DIR, 'roles.json')
 
 # TODO: Add support for fuzzy matching to handle typos and variations
 # TODO: Implement skill versioning (e.g., Python 2 vs Python 3)
 # TODO: Add support for skill synonyms (e.g., "ML" = "Machine Learning")
 
-# NLP Helper: Build regex patterns for skill detection
-def _build_skill_patterns() -> Dict[str, str]:
+# NLP Helper: Build the combined regex pattern for skill detection
+def _build_combined_pattern() -> Optional[re.Pattern]:
     """
-    Build optimized regex patterns for skill detection from our skills matrix.
-    
-    This function creates a dictionary of regex patterns used for skill extraction:
-    1. Loads the skills matrix JSON
-    2. Groups skills by category
-    3. Creates optimized regex patterns for each category
-    4. Handles special characters and word boundaries
-    
-    The patterns are used in our two-pass skill extraction system to accurately
-    identify technical skills in unstructured text like resumes.
-    
+    Build a single precompiled alternation regex covering every known skill.
+
+    Previously we kept one pattern string per category and rescanned the full
+    text once per category, recompiling each pattern on every call. A single
+    compiled alternation scans the text exactly once. Skills are sorted
+    longest-first so multi-word phrases like "machine learning" win over
+    shorter alternatives, which also makes the old multi-word pre-pass
+    unnecessary.
+
     Returns:
-        Dict mapping skill categories to their regex patterns:
-        {
-            'machine_learning': 'tensorflow|pytorch|scikit-learn',
-            'programming': 'python|java|javascript',
-            ...
-        }
-        
+        Compiled pattern matching any known skill at word boundaries,
+        or None if the skills matrix could not be loaded.
+
     Note:
         We escape special characters in skill names to prevent regex errors
         and ensure exact matching when needed.
     """
     try:
-        # Load our skills knowledge base
-        with open(SKILLS_MATRIX_PATH, 'r') as f:
-            skills_data = json.load(f)
-        
-        # Build optimized patterns for each category
-        patterns = {}
-        for category, skills in skills_data.items():
-            # Create regex pattern with escaped special chars
-            pattern = '|'.join(re.escape(skill.lower()) for skill in skills)
-            patterns[category.lower()] = pattern
-        return patterns
+        # Longest-first so the regex engine prefers maximal matches
+        all_skills = sorted(ALL_SKILLS, key=len, reverse=True)
+        if not all_skills:
+            return None
+        pattern = '|'.join(re.escape(skill) for skill in all_skills)
+        return re.compile(r'\b(' + pattern + r')\b', re.IGNORECASE)
     except Exception as e:
         print(f"Error building skill patterns: {e}")
-        return {}
+        return None
+
+# Compile the combined pattern once at import time
+_COMBINED_RE = _build_combined_pattern()
 
-# Initialize patterns from skills matrix
-SKILL_PATTERNS = _build_skill_patterns()
+try:
+    import ahocorasick
+except ImportError:
+    # pyahocorasick is the fast path; the combined regex covers its absence
+    ahocorasick = None
+
+def _is_word_boundary(text: str, end_index: int, skill: str) -> bool:
+    """
+    Check that an automaton match sits on word boundaries.
+
+    Emulates the regex \\b semantics: the characters immediately before
+    and after the matched span must be non-alphanumeric (or the span must
+    touch the start/end of the text).
+    """
+    start = end_index - len(skill) + 1
+    before_ok = start == 0 or not text[start - 1].isalnum()
+    after_ok = end_index == len(text) - 1 or not text[end_index + 1].isalnum()
+    return before_ok and after_ok
 
 def clean_manual_input(text: str) -> List[str]:
     """
@@ -100,18 +110,11 @@ def extract_skills_from_text(text: str) -> Set[str]:
     """
     Extract technical skills from unstructured text using NLP techniques.
     
-    This function implements a sophisticated two-pass skill extraction system:
-    
-    Pass 1 - Exact Phrase Matching:
-    - Looks for multi-word skills (e.g., "machine learning", "data science")
-    - Uses word boundaries to ensure accurate matches
-    - Prevents partial matches within larger words
-    
-    Pass 2 - Pattern-Based Detection:
-    - Uses pre-built regex patterns grouped by skill category
-    - Handles variations in formatting and spacing
-    - Validates matches against our skills database
-    
+    The extraction is a single pass with one precompiled alternation regex:
+    - Covers single- and multi-word skills (longest alternative wins)
+    - Uses word boundaries to prevent partial matches within larger words
+    - Only skills present in our skills matrix can ever match
+
     Args:
         text: Unstructured text to analyze (e.g., resume content)
         
@@ -127,58 +130,76 @@ def extract_skills_from_text(text: str) -> Set[str]:
     Note:
         The function is case-insensitive and handles common formatting variations.
         Skills must exist in our skills matrix to be recognized.
+        Results are cached per input digest — users frequently resubmit
+        the identical resume text after a validation error or refresh.
     """
     if not text:
         return set()
-        
-    # Add word boundaries for accurate matching
-    text_lower = ' ' + text.lower() + ' '
-    all_skills = load_skills_for_parser()
-    found_skills = set()
-    
-    # Pass 1: Multi-word Skill Detection
-    # This pass focuses on complex skill phrases that might be missed by regex
-    for skill in all_skills:
-        if ' ' in skill:  # Multi-word skills need exact matching
-            if f' {skill} ' in text_lower:
-                found_skills.add(skill)
-                
-    # Pass 2: Pattern-Based Skill Detection
-    # Uses our pre-built category-based patterns for single-word skills
-    for category, pattern in SKILL_PATTERNS.items():
-        if pattern:  # Skip empty patterns
-            try:
-                # Use word boundaries (\b) to prevent partial matches
-                matches = re.finditer(r'\b(' + pattern + r')\b', text_lower)
-                for match in matches:
-                    skill = match.group(1).strip()
-                    if skill in all_skills:  # Validate against known skills
-                        found_skills.add(skill)
-            except re.error:
-                print(f"Invalid regex pattern for category {category}")
-                continue
-    
-    return found_skills
+
+    # Key the cache on a short blake2b digest rather than the text itself
+    # so repeated multi-page resumes don't pin their full content in memory
+    digest = hashlib.blake2b(text.encode(), digest_size=8).digest()
+    cached = _EXTRACT_CACHE.get(digest)
+    if cached is not None:
+        return set(cached)
+
+    found = _extract_skills_uncached(text)
+
+    # Bounded FIFO eviction: dicts preserve insertion order, so the first
+    # key is always the oldest entry
+    if len(_EXTRACT_CACHE) >= _EXTRACT_CACHE_MAX:
+        _EXTRACT_CACHE.pop(next(iter(_EXTRACT_CACHE)))
+    _EXTRACT_CACHE[digest] = frozenset(found)
+    return found
+
+def _extract_skills_uncached(text: str) -> Set[str]:
+    """Run the actual skill extraction over the text (no caching)."""
+    # Fast path: Aho-Corasick automaton matches every skill occurrence
+    # (including multi-word phrases) in a single O(len(text)) trie walk.
+    if _SKILL_AUTOMATON is not None:
+        text_lower = text.lower()
+        return {
+            skill
+            for end_index, skill in _SKILL_AUTOMATON.iter(text_lower)
+            if _is_word_boundary(text_lower, end_index, skill)
+        }
+
+    if _COMBINED_RE is None:
+        return set()
+
+    # One scan of the text with the precompiled alternation; the pattern is
+    # built from the skills matrix, so every match is already a known skill.
+    return {match.group(1).lower() for match in _COMBINED_RE.finditer(text)}
+
+# Digest-keyed result cache for extract_skills_from_text
+_EXTRACT_CACHE: Dict[bytes, frozenset] = {}
+_EXTRACT_CACHE_MAX = 512
 
 def load_skills_for_parser() -> Set[str]:
-    """Load and return all valid skills."""
-    try:
-        with open(SKILLS_MATRIX_PATH, 'r') as f:
-            skills_data = json.load(f)
-        all_skills = set()
-        for role_skills in skills_data.values():
-            for skill in role_skills:
-                all_skills.add(skill.lower())
-        return all_skills
-    except Exception as e:
-        print(f"Error loading skills: {e}")
-        return {'python', 'javascript', 'sql', 'aws', 'docker'}
+    """Return all valid skills from the shared, already-parsed matrix."""
+    if ALL_SKILLS:
+        return set(ALL_SKILLS)
+    # Minimal safety net if the skills matrix could not be loaded
+    return {'python', 'javascript', 'sql', 'aws', 'docker'}
+
+def _build_skill_automaton():
+    """Build the Aho-Corasick automaton over all known skills, or None."""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for skill in load_skills_for_parser():
+        automaton.add_word(skill, skill)
+    automaton.make_automaton()
+    return automaton
+
+# Build the automaton once at import time (None if pyahocorasick is missing)
+_SKILL_AUTOMATON = _build_skill_automaton()
 
+@functools.lru_cache(maxsize=1)
 def load_roles_data() -> Dict[str, Dict]:
-    """Load role definitions from roles.json."""
+    """Load role definitions from roles.json (cached after the first call)."""
     try:
-        with open(ROLES_PATH, 'r') as f:
-            return json.load(f)
+        return _load_json_file(ROLES_PATH)
     except Exception as e:
         print(f"Error loading roles: {e}")
         return {}
@@ -20,30 +20,32 @@ Technical Implementation:
 Author: Anslem Akadu
 """
 
-import json
+import copy
+import functools
 import os
 import numpy as np
-from typing import List, Dict, Any, Optional
-from sklearn.metrics.pairwise import cosine_similarity
+from typing import List, Dict, Any, Optional, Tuple
+
+from app._json import load_file
 
 def _load_json_file(filepath: str) -> Dict:
     """
     Safely load and parse JSON data from a file with error handling.
-    
+
     Args:
         filepath: Absolute path to the JSON file
-        
+
     Returns:
         Dict containing the parsed JSON data, or empty dict on error
-        
+
     Note:
         This is a helper function used to load various JSON configuration files
         that define our skills matrix, roles, and learning resources.
+        Delegates to app._json, which uses orjson when available.
     """
     try:
         if os.path.exists(filepath):
-            with open(filepath, 'r') as f:
-                return json.load(f)
+            return load_file(filepath)
     except Exception as e:
         print(f"Error loading {filepath}: {e}")
     return {}
@@ -53,71 +55,199 @@ def _load_roles() -> Dict:
     try:
         base = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
         roles_path = os.path.join(base, "resources", "roles.json")
-        with open(roles_path, 'r') as f:
-            return json.load(f)
+        roles = load_file(roles_path)
+        # Normalize skill casing once at load so the hot paths can rely on
+        # exact membership instead of lowercasing per lookup
+        for role_data in roles.values():
+            role_data["skills"] = [s.lower() for s in role_data.get("skills", [])]
+        return roles
     except Exception as e:
         print(f"Error loading roles: {str(e)}")
         return {}
 
 def _load_learning_resources() -> Dict:
-    """Load learning resources from learning_resources.json"""
+    """Load learning resources from learning_resources.json, keys lowercased."""
     base = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
-    return _load_json_file(os.path.join(base, "resources", "learning_resources.json"))
+    raw = _load_json_file(os.path.join(base, "resources", "learning_resources.json"))
+    return {skill.lower(): resources for skill, resources in raw.items()}
 
-def _load_skills_space() -> List[str]:
-    """Load the global skill space from skills_matrix.json"""
+def _load_skills_space(roles: Dict) -> List[str]:
+    """Build the global skill space from skills_matrix.json plus role skills."""
     base = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
-    return _load_json_file(os.path.join(base, "resources", "skills_matrix.json"))
+    matrix = _load_json_file(os.path.join(base, "resources", "skills_matrix.json"))
+    # Flatten the category -> skills mapping into one sorted skill list;
+    # vectors are positions over skills, not category names. Union in the
+    # role requirements so a skill listed in roles.json but missing from
+    # the matrix still gets a vector position — otherwise it would vanish
+    # from skill-gap lists and deflate the per-role requirement counts.
+    space = {skill.lower() for skills in matrix.values() for skill in skills}
+    for role_data in roles.values():
+        space.update(role_data.get("skills", []))
+    return sorted(space)
 
 
 # Load data at module level
 roles_data = _load_roles()
 learning_resources = _load_learning_resources()
-skill_space = _load_skills_space()
+skill_space = _load_skills_space(roles_data)
 
-def load_learning_resources(skill: str) -> List[Dict]:
-    """
-    Get learning resources for a given skill.
-    Returns list of resources sorted by level (Beginner first).
-    """
-    resources = learning_resources.get(skill.lower(), [])
-    if not resources:
-        return [{"name": "Resource not available yet", "type": "N/A", "url": "#", "level": "N/A"}]
-    
-    # Sort by level priority: Beginner -> Intermediate -> Advanced
-    level_priority = {"Beginner": 0, "Intermediate": 1, "Advanced": 2}
-    return sorted(resources, key=lambda x: level_priority.get(x.get("level", ""), 999))[:2]
+# Position lookup for the skill space: vector construction scatters into
+# known indices instead of scanning the whole space per skill
+SKILL_INDEX = {s: i for i, s in enumerate(skill_space)}
+N_SKILLS = len(skill_space)
+
+# Name lookup for the reverse direction: boolean masks over the skill
+# space turn back into skill-name lists with one fancy-indexing op
+SKILL_NAMES = np.array(skill_space, dtype=object)
 
 # ML Core: Skill Vector Generation
-def skills_to_vector(user_skills: List[str], skill_space: List[str]) -> np.ndarray:
+def skills_to_vector(user_skills: List[str], space: Optional[List[str]] = None) -> np.ndarray:
     """
     Convert a list of user skills into a binary vector in the global skill space.
-    
+
     This is a core ML function that transforms text-based skills into a numerical
-    vector that can be used for similarity calculations. Each position in the vector
-    corresponds to a skill in our global skill space, with 1 indicating the user
-    has the skill and 0 indicating they don't.
-    
+    vector that can be used for similarity calculations. Each position in the
+    vector corresponds to a skill in our global skill space, with 1 indicating
+    the user has the skill and 0 indicating they don't.
+
     Args:
         user_skills: List of skills the user has indicated they possess
-        skill_space: The global list of all possible skills in our system
-        
+        space: Ignored; retained for backwards compatibility. Vectors are
+            always built over the module-level skill space via SKILL_INDEX.
+
     Returns:
-        numpy.ndarray: Binary vector representation of user's skills
-        
-    Example:
-        >>> skills = ['python', 'javascript']
-        >>> space = ['python', 'java', 'javascript', 'c++']
-        >>> skills_to_vector(skills, space)
-        array([1, 0, 1, 0])
+        numpy.ndarray: Binary float32 vector representation of user's skills
+
+    Technical Details:
+        Uses the precomputed SKILL_INDEX dict to scatter 1.0 into known
+        positions — one hash lookup per user skill — rather than testing
+        every skill-space entry against the user list.
+    """
+    vec = np.zeros(N_SKILLS, dtype=np.float32)
+    indices = [SKILL_INDEX[s] for s in user_skills if s in SKILL_INDEX]
+    if indices:
+        vec[indices] = 1.0
+    return vec
+
+def _build_role_index(roles: Dict) -> tuple:
+    """Build the precomputed role structures from a roles mapping."""
+    keys = list(roles.keys())
+    if keys:
+        matrix = np.stack([skills_to_vector(roles[slug]["skills"]) for slug in keys])
+    else:
+        matrix = np.zeros((0, N_SKILLS), dtype=np.float32)
+    norms = np.linalg.norm(matrix, axis=1)
+    # Bit-packed view: 1 bit per skill instead of 4 bytes, so the whole
+    # catalog fits in a few cache lines and intersections become SIMD
+    # bitwise ANDs plus popcounts rather than FP multiply-adds
+    bits = np.packbits(matrix.astype(np.uint8), axis=1)
+    counts = matrix.sum(axis=1)
+    skill_sets = {slug: frozenset(d["skills"]) for slug, d in roles.items()}
+    # Inverted index: skill -> tuple of role indices requiring it, so a
+    # query can prune to candidate roles with hash lookups instead of
+    # touching every role
+    skill_to_roles: Dict[str, tuple] = {}
+    for index, slug in enumerate(keys):
+        for skill in roles[slug]["skills"]:
+            skill_to_roles[skill] = skill_to_roles.get(skill, ()) + (index,)
+    return keys, matrix, bits, norms, counts, skill_sets, skill_to_roles
+
+# Precomputed role index: one binary row per role over the skill space.
+# Stacking these once at import turns the per-request role loop into a
+# single matrix-vector product instead of N separate cosine calls.
+# ROLE_SKILL_SETS gives O(1) membership for matched/missing checks.
+(ROLE_KEYS, ROLE_MATRIX, ROLE_MATRIX_BITS, ROLE_NORMS,
+ ROLE_SKILL_COUNTS, ROLE_SKILL_SETS, SKILL_TO_ROLES) = _build_role_index(roles_data)
+
+@functools.lru_cache(maxsize=2048)
+def load_learning_resources(skill: str) -> Tuple[Dict, ...]:
+    """
+    Get learning resources for a given skill.
+    Returns a tuple of resources sorted by level (Beginner first).
+
+    The result is memoized — skill names form a small closed set and the
+    sort is re-run constantly otherwise. Callers must treat the returned
+    tuple (and the dicts inside it) as read-only.
+    """
+    # Keys are lowercased at load time; callers normalize input casing
+    # once at request entry, so no per-call .lower() is needed here
+    resources = learning_resources.get(skill, [])
+    if not resources:
+        return ({"name": "Resource not available yet", "type": "N/A", "url": "#", "level": "N/A"},)
+
+    # Sort by level priority: Beginner -> Intermediate -> Advanced
+    level_priority = {"Beginner": 0, "Intermediate": 1, "Advanced": 2}
+    return tuple(sorted(resources, key=lambda x: level_priority.get(x.get("level", ""), 999))[:2])
+
+try:
+    from numba import njit, prange
+except ImportError:
+    # Numba is optional: at the current catalog size the numpy popcount
+    # path is already sub-millisecond, so we don't require the dependency
+    njit = None
+
+if njit is not None:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _cos_all_numba(role_matrix, user_vec, role_norms, role_counts):  # pragma: no cover
+        """
+        Fused scoring kernel: one pass over the role matrix computes the
+        match count, cosine similarity, and completion percentage for
+        every role, parallelized across rows. Pays off once the catalog
+        grows to thousands of roles; the numpy path remains the fallback.
+        """
+        n_roles = role_matrix.shape[0]
+        n_skills = role_matrix.shape[1]
+        matched = np.empty(n_roles, dtype=np.float32)
+        sims = np.empty(n_roles, dtype=np.float32)
+        completions = np.empty(n_roles, dtype=np.float32)
+        user_norm = np.sqrt(user_vec.sum())
+        for i in prange(n_roles):
+            dot = np.float32(0.0)
+            for j in range(n_skills):
+                dot += role_matrix[i, j] * user_vec[j]
+            matched[i] = dot
+            sims[i] = dot / (role_norms[i] * user_norm + np.float32(1e-12))
+            if role_counts[i] > 0:
+                completions[i] = dot / role_counts[i] * np.float32(100.0)
+            else:
+                completions[i] = np.float32(0.0)
+        return matched, sims, completions
+
+def _score_all_roles(user_vec: np.ndarray) -> tuple:
     """
-    return np.array([1 if skill in user_skills else 0 for skill in skill_space])
+    Score the user vector against every role at once.
+
+    Returns (matched_counts, sims, completions) arrays. Uses the fused
+    Numba kernel when numba is installed, otherwise the packed-bit
+    popcount path: for binary vectors the dot product is just
+    |role & user|, computed as a bitwise AND over the packed role matrix.
+    """
+    if njit is not None:
+        return _cos_all_numba(
+            ROLE_MATRIX, user_vec, ROLE_NORMS.astype(np.float32),
+            ROLE_SKILL_COUNTS.astype(np.float32)
+        )
+    user_bits = np.packbits(user_vec.astype(np.uint8))
+    matched_counts = np.unpackbits(ROLE_MATRIX_BITS & user_bits[None, :], axis=1).sum(axis=1)
+    user_norm = np.sqrt(user_vec.sum())
+    sims = matched_counts / (ROLE_NORMS * user_norm + 1e-12)
+    completions = np.where(
+        ROLE_SKILL_COUNTS > 0, matched_counts / ROLE_SKILL_COUNTS * 100.0, 0.0
+    )
+    return matched_counts, sims, completions
 
 # ML Core: Role Recommendation Engine
 def recommend_roles(user_skills: List[str], top_k: int = 3) -> Dict:
     """
     Recommend the top-K most suitable career paths based on user's current skills.
-    
+
+    Results are memoized per normalized skill set: page refreshes and
+    back-navigation resubmit identical skills constantly, and the pipeline
+    is pure over the module-level data, so `(frozenset(skills), top_k)`
+    fully determines the answer. The cached result is deep-copied before
+    returning so callers can mutate it freely. `reload_data()` clears
+    the cache.
+
     This function implements the core recommendation logic:
     1. Convert user skills to a vector
     2. Compare against each potential role using cosine similarity
@@ -148,45 +278,67 @@ def recommend_roles(user_skills: List[str], top_k: int = 3) -> Dict:
         >>> print(result['analysis_summary'])
         'Found 2 recommended roles based on your 3 skills'
     """
-    user_vec = skills_to_vector(user_skills, skill_space)
-    recommendations = []
-
-    for role_slug, role_data in roles_data.items():
-        role_vec = skills_to_vector(role_data["skills"], skill_space)
-        
-        similarity = cosine_similarity([user_vec], [role_vec])[0][0]
-
-        # Find matched and missing skills
-        matched = [s for s in user_skills if s in role_data["skills"]]
-        missing = [s for s in role_data["skills"] if s not in user_skills]
-        
-        # Get learning resources for missing skills
-        skill_resources = {
-            skill: load_learning_resources(skill)
-            for skill in missing
-        }
-
-        # Calculate completion percentage
-        total_skills = len(role_data["skills"])
-        completion = (len(matched) / total_skills * 100) if total_skills > 0 else 0
+    key = frozenset(s.lower() for s in user_skills)
+    return copy.deepcopy(_recommend_roles_cached(key, top_k))
+
+@functools.lru_cache(maxsize=4096)
+def _recommend_roles_cached(skill_key: frozenset, top_k: int) -> Dict:
+    """Core recommendation pipeline, keyed on the normalized skill set."""
+    user_skills = sorted(skill_key)
+    user_vec = skills_to_vector(user_skills)
+
+    # Score every role in one vectorized pass (numba kernel when available)
+    matched_counts, sims, completions = _score_all_roles(user_vec)
+
+    # Candidate pruning via the inverted index: only roles sharing at
+    # least one skill with the user can score above zero. When pruning
+    # would leave fewer than top_k candidates, keep the full catalog so
+    # the response still pads out with zero-match roles as before.
+    candidate_set = {i for s in user_skills for i in SKILL_TO_ROLES.get(s, ())}
+    if len(candidate_set) >= top_k:
+        role_indices = np.fromiter(sorted(candidate_set), dtype=np.intp)
+    else:
+        role_indices = np.arange(len(ROLE_KEYS))
 
+    recommendations = []
+    for role_index in role_indices:
+        role_slug = ROLE_KEYS[role_index]
+        role_data = roles_data[role_slug]
         recommendations.append({
             "role_slug": role_slug,
             "career": role_data["career"],
-            "score": round(float(similarity), 3),
-            "matched_skills": matched,
-            "missing_skills": missing,
-            "resources": skill_resources,
-            "completion_percentage": round(completion, 1),
-            "analysis": f"Matched {len(matched)} of {total_skills} required skills"
+            "score": round(float(sims[role_index]), 3),
+            "completion_percentage": round(float(completions[role_index]), 1),
+            "analysis": f"Matched {int(matched_counts[role_index])} of {int(ROLE_SKILL_COUNTS[role_index])} required skills"
         })
 
-    # Sort by completion percentage and similarity score
-    top_recommendations = sorted(
-        recommendations,
-        key=lambda x: (x["completion_percentage"], x["score"]),
-        reverse=True
-    )[:top_k]
+    # Top-K selection by (completion, score) without a full sort: fuse the
+    # two keys into one array (completion dominates; sims are <= 1, so the
+    # 1e6 factor keeps the ordering lexicographic) and argpartition it.
+    ranking = completions[role_indices] * 1_000_000 + sims[role_indices]
+    k = min(top_k, len(recommendations))
+    if k:
+        top_local = np.argpartition(-ranking, k - 1)[:k]
+        top_local = top_local[np.argsort(-ranking[top_local])]
+        top_recommendations = [recommendations[i] for i in top_local]
+        top_idx = role_indices[top_local]
+    else:
+        top_idx = []
+        top_recommendations = []
+
+    # Fill in skill lists and learning resources only for the K survivors;
+    # discarded roles never pay for the list building or resource lookups.
+    # Matched/missing come from boolean masks over the role matrix rather
+    # than per-role Python comprehensions (names in skill-space order).
+    user_mask = user_vec.astype(bool)
+    for role_index, rec in zip(top_idx, top_recommendations):
+        role_mask = ROLE_MATRIX[role_index].astype(bool)
+        rec["matched_skills"] = SKILL_NAMES[role_mask & user_mask].tolist()
+        rec["missing_skills"] = SKILL_NAMES[role_mask & ~user_mask].tolist()
+        rec["resources"] = {
+            skill: load_learning_resources(skill)
+            for skill in rec["missing_skills"]
+        }
 
     return {
         "recommendations": top_recommendations,
@@ -252,11 +404,9 @@ def analyze_career_transition(
         ... )
         >>> print(f"Completion: {result['completion_percentage']}%")
     """
-    
-    # Load roles data
-    roles_data = _load_roles()
-    
-    # Get target role data and validate
+
+    # Get target role data and validate (module-level roles_data is loaded
+    # once per process; use reload_data() in development to pick up edits)
     target_role_data = roles_data.get(target_role_slug)
     if not target_role_data:
         raise ValueError(f"Invalid target role: {target_role_slug}")
@@ -291,37 +441,37 @@ def analyze_career_transition(
 
     # Generate learning resources and phases
     skills_to_process = analysis_result["missing_skills"]
-    
-    # Generate learning resources
-    for skill in skills_to_process:
-        analysis_result["learning_resources"][skill] = load_learning_resources(skill)
 
-    # Create phases
+    # Resolve each distinct skill exactly once (defensive dedup — skill
+    # lists shouldn't repeat, but a repeat would otherwise double the
+    # lookups); the phases below only slice the pairs list
+    resolved = {s: load_learning_resources(s) for s in set(skills_to_process)}
+    analysis_result["learning_resources"] = resolved
+    pairs = [(skill, resolved[skill]) for skill in skills_to_process]
+
+    # Create phases by slicing the resolved (skill, resources) pairs
     skills_per_phase = max(1, len(skills_to_process) // 3)
     phases = []
 
-    if skills_to_process[:skills_per_phase]:
+    if pairs[:skills_per_phase]:
         phases.append({
             "name": "Foundation Skills",
             "description": "Essential skills to build your base knowledge",
-            "skills": [(skill, analysis_result["learning_resources"][skill]) 
-                      for skill in skills_to_process[:skills_per_phase]]
+            "skills": pairs[:skills_per_phase]
         })
-    
-    if skills_to_process[skills_per_phase:skills_per_phase*2]:
+
+    if pairs[skills_per_phase:skills_per_phase*2]:
         phases.append({
             "name": "Core Development",
             "description": "Build your technical expertise",
-            "skills": [(skill, analysis_result["learning_resources"][skill]) 
-                      for skill in skills_to_process[skills_per_phase:skills_per_phase*2]]
+            "skills": pairs[skills_per_phase:skills_per_phase*2]
         })
-    
-    if skills_to_process[skills_per_phase*2:]:
+
+    if pairs[skills_per_phase*2:]:
         phases.append({
             "name": "Advanced Topics",
             "description": "Master advanced concepts",
-            "skills": [(skill, analysis_result["learning_resources"][skill]) 
-                      for skill in skills_to_process[skills_per_phase*2:]]
+            "skills": pairs[skills_per_phase*2:]
         })
 
     analysis_result["phases"] = phases
@@ -351,9 +501,13 @@ def generate_recommendations(analysis_result: Dict[str, Any]) -> List[Dict]:
     intermediate_skills = []
     advanced_skills = []
 
+    # Reuse resources already resolved by analyze_career_transition where
+    # possible instead of re-running the lookup per skill
+    resolved = analysis_result.get('learning_resources') or {}
+
     # Distribute skills across phases
     for i, skill in enumerate(skills_to_process):
-        resources = load_learning_resources(skill)
+        resources = resolved.get(skill) or load_learning_resources(skill)
         skill_with_resources = (skill, resources)
         
         if i < 3:  # First 3 skills go to foundation
@@ -389,15 +543,34 @@ def generate_recommendations(analysis_result: Dict[str, Any]) -> List[Dict]:
 
     return phases
 
+@functools.lru_cache(maxsize=256)
 def get_required_skills(role_name):
-    """Get the required skills for a specific role."""
+    """Get the required skills for a specific role (memoized)."""
     try:
-        roles = _load_roles()
-        role_data = roles.get(role_name, {})
+        role_data = roles_data.get(role_name, {})
         return role_data.get("skills", [])
     except Exception as e:
         print(f"Error getting required skills: {e}")
         return []
 
+def reload_data() -> None:
+    """
+    Reload roles and learning resources from disk and rebuild caches.
+
+    Development helper: the hot paths read the module-level data loaded
+    once at import, so edits to the JSON resources only become visible
+    after calling this (or restarting the worker).
+    """
+    global roles_data, learning_resources
+    global ROLE_KEYS, ROLE_MATRIX, ROLE_MATRIX_BITS, ROLE_NORMS
+    global ROLE_SKILL_COUNTS, ROLE_SKILL_SETS, SKILL_TO_ROLES
+    roles_data = _load_roles()
+    learning_resources = _load_learning_resources()
+    (ROLE_KEYS, ROLE_MATRIX, ROLE_MATRIX_BITS, ROLE_NORMS,
+     ROLE_SKILL_COUNTS, ROLE_SKILL_SETS, SKILL_TO_ROLES) = _build_role_index(roles_data)
+    load_learning_resources.cache_clear()
+    get_required_skills.cache_clear()
+    _recommend_roles_cached.cache_clear()
+
 
 
@@ -0,0 +1,38 @@
+"""
+Shared Resource Data
+
+Loads skills_matrix.json exactly once per process and exposes it to the
+rest of the app. Previously the parser, the NLP utilities, and the
+pattern builder each re-read and re-parsed the same file, tripling the
+startup I/O. The parsed mapping is wrapped in a MappingProxyType so it
+stays read-only, which also keeps it copy-on-write-sharable across
+gunicorn forks when the master preloads the app.
+
+Exposed constants:
+- SKILLS_MATRIX: read-only mapping of category -> list of skill names
+- ALL_SKILLS: frozenset of every known skill, lowercased
+
+Author: Anslem Akadu
+"""
+
+import os
+import types
+
+from app._json import load_file as _load_json_file
+
+RESOURCES_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'resources'))
+SKILLS_MATRIX_PATH = os.path.join(RESOURCES_DIR, 'skills_matrix.json')
+
+try:
+    _raw = _load_json_file(SKILLS_MATRIX_PATH)
+except Exception as e:
+    print(f"Error loading skills matrix: {e}")
+    _raw = {}
+
+# Read-only view of the parsed skills matrix
+SKILLS_MATRIX = types.MappingProxyType(_raw)
+
+# Flat, normalized view used by the extractors
+ALL_SKILLS = frozenset(
+    skill.lower() for skills in _raw.values() for skill in skills
+)
@@ -22,8 +22,13 @@ Data Flow:
 Author: Anslem Akadu
 """
 
-import json
-from flask import Blueprint, render_template, request, flash, redirect, url_for, session
+import copy
+import functools
+import logging
+import os
+import re
+from flask import Blueprint, render_template, stream_template, request, flash, redirect, url_for
+from app._json import load_file as _load_json_file
 from app.parser import parse_user_input
 from app.recommender import (
     analyze_career_transition,
@@ -33,26 +38,105 @@ from app.recommender import (
     roles_data
 )
 from app.file_utils import process_resume_upload
+from app.resources import RESOURCES_DIR
 
 # Create a Flask Blueprint for our routes
 # This allows for modular application structure and easier testing
 main_routes = Blueprint("main_routes", __name__)
 
+logger = logging.getLogger(__name__)
+
 # Load role definitions at module level for better performance
-# This prevents reloading the data on every request
+# This prevents reloading the data on every request. The absolute path
+# makes the load independent of the process working directory, and the
+# frozenset gives O(1) membership for the per-request role validations.
 try:
-    with open("resources/roles.json") as f:
-        ROLES_DATA = json.load(f)
-        AVAILABLE_ROLES = list(ROLES_DATA.keys())
+    ROLES_DATA = _load_json_file(os.path.join(RESOURCES_DIR, "roles.json"))
+    AVAILABLE_ROLES = frozenset(ROLES_DATA)
+    # Stable, file-ordered list for rendering the role dropdowns
+    ROLE_CHOICES = list(ROLES_DATA)
 except Exception as e:
     print(f"Error loading roles data: {e}")
     ROLES_DATA = {}
-    AVAILABLE_ROLES = []
+    AVAILABLE_ROLES = frozenset()
+    ROLE_CHOICES = []
+
+# Skill tokenizer: one compiled pass instead of split + per-token strip.
+# Accepts commas, semicolons, and newlines as separators.
+_SKILL_RE = re.compile(r"[^,;\n]+")
+
+# Reject resume uploads above this size before any parsing happens; a
+# huge PDF would otherwise be fully buffered and parsed before failing.
+# The app-level MAX_CONTENT_LENGTH (16MB) still backstops the whole body.
+MAX_RESUME_BYTES = 5 * 1024 * 1024
 
 # TODO: Add role data validation and error handling
 # TODO: Implement role data caching with TTL
 # TODO: Add API versioning for future compatibility
 
+def canonicalize_skills(raw) -> list:
+    """
+    Strip, lowercase, and dedupe a skill iterable, preserving first-seen order.
+
+    Resume-derived and form-derived skill lists routinely contain
+    duplicates differing only in case or whitespace ('Python', 'python ');
+    canonicalizing once here means the recommender and analysis pipeline
+    never re-normalize or score the same skill twice.
+    """
+    seen = set()
+    out = []
+    for s in raw:
+        k = s.strip().lower()
+        if k and k not in seen:
+            seen.add(k)
+            out.append(k)
+    return out
+
+@functools.lru_cache(maxsize=1024)
+def _cached_transition(skills_key: tuple, current_role_slug, target_role_slug, transition_type):
+    """lru_cache-compatible core for cached_career_transition."""
+    return analyze_career_transition(
+        user_skills=list(skills_key),
+        current_role_slug=current_role_slug,
+        target_role_slug=target_role_slug,
+        transition_type=transition_type
+    )
+
+def cached_career_transition(user_skills, current_role_slug, target_role_slug, transition_type):
+    """
+    Memoized front for analyze_career_transition.
+
+    Identical submissions are common (refreshes, back-navigation,
+    switching between recommendation cards), so results are cached on a
+    canonical (sorted, lowercased) skill tuple plus the role pair. The
+    cached dict is deep-copied before returning so templates and session
+    storage can't mutate the shared entry.
+    """
+    skills_key = tuple(sorted({s.lower() for s in user_skills if s}))
+    return copy.deepcopy(
+        _cached_transition(skills_key, current_role_slug, target_role_slug, transition_type)
+    )
+
+def _extract_resume_text(files):
+    """
+    Pull the text out of an uploaded resume, if one was provided.
+
+    Shared by the recommend fast path and the main analysis pipeline.
+    Returns the extracted text, or None when no usable file is present.
+
+    Raises:
+        ValueError: If the upload is too large or text extraction fails
+    """
+    # Size gate first: content_length covers the whole request body,
+    # which upper-bounds the upload, so oversized files bounce before
+    # the PDF/DOCX parser ever sees a byte
+    if request.content_length and request.content_length > MAX_RESUME_BYTES:
+        raise ValueError('Resume file is too large (max 5 MB).')
+    file = files.get('resume')
+    if file and file.filename and allowed_file(file.filename):
+        return process_resume_upload(file)
+    return None
+
 def allowed_file(filename: str) -> bool:
     """
     Validate file types for secure resume uploads.
@@ -90,7 +174,7 @@ def home():
         - Dynamic form fields
         - File upload options
     """
-    return render_template("index.html", roles=AVAILABLE_ROLES)
+    return render_template("index.html", roles=ROLE_CHOICES)
 
 @main_routes.route('/select-role', methods=['POST'])
 def select_role():
@@ -117,18 +201,19 @@ def select_role():
         - Missing skills → Redirect to home with error message
         - Analysis errors → Redirect to home with error details
     """
-    role_slug = request.form.get('role_slug')
-    skills_str = request.form.get('skills')
-    
+    form = request.form
+    role_slug = form.get('role_slug')
+    skills_str = form.get('skills')
+
     if not role_slug or not skills_str:
         flash('Invalid role selection.', 'error')
         return redirect(url_for('main_routes.home'))
-    
+
     try:
-        user_skills = [s.strip() for s in skills_str.split(',')]
+        user_skills = canonicalize_skills(m.group(0) for m in _SKILL_RE.finditer(skills_str))
         
-        # Get career transition analysis
-        analysis = analyze_career_transition(
+        # Get career transition analysis (cached per skill set + role)
+        analysis = cached_career_transition(
             user_skills=user_skills,
             current_role_slug=None,
             target_role_slug=role_slug,
@@ -137,7 +222,7 @@ def select_role():
         
         phases = generate_recommendations(analysis)
         
-        return render_template(
+        return stream_template(
             'results.html',
             transition_type='selected_role',
             analysis=analysis,
@@ -193,12 +278,17 @@ def analyze_skills():
         - Input sanitization
         - Error message sanitization
     """
-    # Extract and validate form data
-    path = request.form.get('path')
-    current_role = request.form.get('current_role', '').strip()
-    target_role = request.form.get('target_role', '').strip()
-    skills_text = request.form.get('skills', '').strip()
-    raw_skills = request.form.get('raw_skills', '').strip()
+    # Extract and validate form data. Bind request.form once — each
+    # request.form access re-runs werkzeug's cached-property machinery,
+    # and these five lookups are on every request's hot path.
+    form = request.form
+    files = request.files
+    path = form.get('path')
+    current_role = form.get('current_role', '').strip()
+    target_role = form.get('target_role', '').strip()
+    skills_text = form.get('skills', '').strip()
+    raw_skills = form.get('raw_skills', '').strip()
+    has_resume = 'resume' in files
     
     # Handle different analysis paths based on user's request
     if path == 'recommend':
@@ -207,18 +297,20 @@ def analyze_skills():
         transition_type = 'recommend'
         
         # Validate input: require either manual skills or resume
-        if not skills_text and not raw_skills and 'resume' not in request.files:
+        if not skills_text and not raw_skills and not has_resume:
             flash('Please provide your skills either by pasting them or uploading a resume.', 'error')
             return redirect(url_for('main_routes.home'))
             
         try:
-            # Step 1: Extract and normalize skills
-            # We don't need role information for pure recommendations
+            # Step 1: Extract and normalize skills. Resume-only submissions
+            # skip the manual-input normalization entirely (skills=None);
+            # the resume text goes straight to the extraction automaton.
+            resume_text = _extract_resume_text(files) if has_resume else None
             parsed = parse_user_input(
                 target_role=None,  # Not needed for recommendations
                 current_role=None, # Not needed for recommendations
-                skills=skills_text,
-                resume_text=None,  # Resume processing handled separately
+                skills=skills_text or None,
+                resume_text=resume_text,
                 transition_type='recommend'
             )
             
@@ -240,7 +332,7 @@ def analyze_skills():
                     reverse=True
                 )[:3]  # Limit to top 3 matches
             
-            return render_template(
+            return stream_template(
                 'results.html',
                 transition_type='recommend',
                 analysis=analysis,
@@ -300,49 +392,26 @@ def analyze_skills():
     # Resume Processing Section
     # Handle file uploads and extract text content
     resume_text = None
-    if 'resume' in request.files:
-        file = request.files['resume']
-        if file and file.filename and allowed_file(file.filename):
-            try:
-                # Extract text from resume using our NLP pipeline
-                resume_text = process_resume_upload(file)
-            except Exception as e:
-                # Provide user-friendly error message while logging details
-                print(f"Resume processing error: {str(e)}")  # For debugging
-                flash('Could not read file. Please upload PDF/DOCX or paste skills.', 'error')
-                return redirect(url_for('main_routes.home'))
+    if has_resume:
+        try:
+            # Extract text from resume using our NLP pipeline
+            resume_text = _extract_resume_text(files)
+        except Exception as e:
+            # Provide user-friendly error message while logging details
+            logger.warning("Resume processing error: %s", e)
+            flash('Could not read file. Please upload PDF/DOCX or paste skills.', 'error')
+            return redirect(url_for('main_routes.home'))
 
     # Skill Analysis Pipeline
+    # (The recommend path already returned above — no need to re-check it
+    # here, which used to run parse + recommend twice per request.)
     try:
-        # For recommendation path: Focus on skill matching
-        if path == 'recommend':
-            # Extract and analyze skills without role context
-            parsed = parse_user_input(
-                target_role=None,     # No target role needed
-                current_role=None,     # No current role needed
-                skills=skills_text,    # Manual skill input
-                resume_text=resume_text,# Extracted resume text
-                transition_type='recommend'
-            )
-            
-            if parsed.get('error'):
-                flash(parsed['error'], 'error')
-                return redirect(url_for('main_routes.home'))
-                
-            # Get top 3 role recommendations
-            recommendations = recommend_roles(parsed.get('skills', []))
-            return render_template(
-                'results.html',
-                transition_type='recommend',
-                recommendations=recommendations,
-                user_skills=parsed.get('skills', [])
-            )
-        
-        # For other paths, continue with normal flow
+        # Resume-only submissions pass skills=None so the parser skips
+        # manual-input normalization and goes straight to text extraction
         parsed = parse_user_input(
             target_role=target_role,
             current_role=current_role,
-            skills=skills_text,
+            skills=skills_text or None,
             resume_text=resume_text,
             transition_type=transition_type
         )
@@ -351,38 +420,35 @@ def analyze_skills():
             flash(parsed['error'], 'error')
             return redirect(url_for('main_routes.home'))
             
-        # Analyze career transition
-        analysis = analyze_career_transition(
+        # Analyze career transition (cached per skill set + role pair)
+        analysis = cached_career_transition(
             user_skills=parsed.get('skills', []),
             current_role_slug=current_role,
             target_role_slug=target_role,
             transition_type=transition_type
         )
         
-        # Log analysis results for monitoring and debugging
-        # TODO: Replace with proper logging system
-        print("Analysis result:", analysis)
-        print("Skills found:", analysis.get('matched_skills'))
-        print("Missing skills:", analysis.get('missing_skills'))
-        print("Resources:", analysis.get('learning_resources'))
-        
-        # Cache analysis results in session
-        # TODO: Move to Redis/proper caching system for scalability
-        session['analysis'] = analysis
+        # Log analysis results for monitoring and debugging. logger.debug
+        # with %r defers formatting entirely: at INFO and above the large
+        # analysis dict is never stringified (the old prints paid for the
+        # full repr on every request even when nobody read it).
+        logger.debug("Analysis result: %r", analysis)
+        logger.debug("Skills found: %r", analysis.get('matched_skills'))
+        logger.debug("Missing skills: %r", analysis.get('missing_skills'))
+        logger.debug("Resources: %r", analysis.get('learning_resources'))
         
         # Return results to frontend
-        return render_template('results.html', 
+        return stream_template('results.html', 
             analysis=analysis,          # ML analysis results
             transition_type=transition_type,  # Path type
             current_role=current_role,  # Starting point
             target_role=target_role     # Career goal
         )
         
-    except Exception as e:
-        # Log the error for debugging
-        # TODO: Add proper error logging and monitoring
-        print(f"Error in skill analysis: {str(e)}")
-        
+    except Exception:
+        # Log the error with traceback for debugging
+        logger.exception("Error in skill analysis")
+
         # Show user-friendly error message
         flash("An error occurred while analyzing your career path. Please try again.", 'error')
         return redirect(url_for('main_routes.home'))
@@ -0,0 +1,50 @@
+"""
+Shared Scenario Matrix for Parser and Recommender Tests
+
+Both test modules exercise the same career-transition scenarios; keeping
+one matrix here means a single source of truth for the inputs, and the
+parser tests warm exactly the argument tuples the recommender's cache
+shims are keyed on.
+
+Author: Anslem Akadu
+"""
+
+from typing import NamedTuple, Optional
+
+class Case(NamedTuple):
+    """One transition scenario in both its raw-form and canonical shape."""
+    skills: tuple               # canonical skill tuple (recommender input)
+    skills_str: Optional[str]   # manual-entry form string (parser input)
+    current: Optional[str]      # current role slug, or None
+    target: str                 # target role slug
+    transition_type: str
+    expect_skill: Optional[str]  # a skill that must survive parsing
+
+CASES = [
+    Case(
+        skills=("python", "pandas", "scikit-learn", "sql"),
+        skills_str="python, pandas, scikit-learn, sql",
+        current="data_scientist",
+        target="ml_engineer",
+        transition_type="upskill",
+        expect_skill="python",
+    ),
+    Case(
+        skills=(),
+        skills_str=None,
+        current=None,
+        target="data_scientist",
+        transition_type="beginner",
+        expect_skill=None,
+    ),
+    Case(
+        skills=("python", "flask", "postgresql"),
+        skills_str="python, flask, postgresql",
+        current="backend_engineer",
+        target="backend_engineer",
+        transition_type="same_role",
+        expect_skill="python",
+    ),
+]
+
+CASE_IDS = ["transition", "beginner", "same_role"]
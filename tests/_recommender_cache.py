@@ -0,0 +1,74 @@
+"""
+Cross-Session Recommender Result Cache
+
+The in-process lru_cache shims in the test modules only help within one
+pytest invocation; dev loops run pytest over and over. This module
+persists analyze_career_transition outputs for the fixed test inputs to
+a pickle under .pytest_cache, so later sessions load precomputed
+results instead of re-running the pipeline.
+
+Entries are invalidated wholesale whenever any of the JSON resource
+files the recommender reads — or the recommender/parser source itself —
+is newer than the stamp stored with the pickle, so neither data edits
+nor code edits ever serve stale analyses.
+
+Author: Anslem Akadu
+"""
+
+import pickle
+from pathlib import Path
+
+from app import parser as _parser
+from app import recommender as _recommender
+from app.resources import RESOURCES_DIR
+
+CACHE_PATH = Path(".pytest_cache") / "recommender_results.pkl"
+
+_RESOURCE_FILES = ("roles.json", "learning_resources.json", "skills_matrix.json")
+
+# Editing the pipeline code must invalidate cached outputs just like
+# editing the data it reads, or regressions hide behind stale pickles
+_SOURCE_FILES = (_parser.__file__, _recommender.__file__)
+
+_cache = None
+
+def _data_stamp() -> float:
+    """Newest mtime across the JSON resources and pipeline source files."""
+    newest = 0.0
+    paths = [Path(RESOURCES_DIR) / name for name in _RESOURCE_FILES]
+    paths += [Path(name) for name in _SOURCE_FILES]
+    for path in paths:
+        try:
+            newest = max(newest, path.stat().st_mtime)
+        except OSError:
+            pass
+    return newest
+
+def _load() -> dict:
+    """Load the cache dict once per process, discarding stale pickles."""
+    global _cache
+    if _cache is None:
+        try:
+            with open(CACHE_PATH, "rb") as f:
+                stamp, entries = pickle.load(f)
+            _cache = entries if stamp == _data_stamp() else {}
+        except Exception:
+            # Missing, unreadable, or incompatible pickle — start fresh
+            _cache = {}
+    return _cache
+
+def get(key):
+    """Return the cached result for key, or None."""
+    return _load().get(key)
+
+def put(key, value) -> None:
+    """Store a result and write the cache through to disk."""
+    entries = _load()
+    entries[key] = value
+    try:
+        CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        with open(CACHE_PATH, "wb") as f:
+            pickle.dump((_data_stamp(), entries), f)
+    except OSError:
+        # A read-only checkout just loses cross-session caching
+        pass
@@ -0,0 +1,21 @@
+"""
+Shared Test Fixtures and Constants
+
+Holds the fixtures and canonical inputs used across the ElevatrAI test
+modules so each file doesn't rebuild its own copies per test.
+
+Author: Anslem Akadu
+"""
+
+import pytest
+
+# Canonical skill set used by the recommender tests. A tuple instead of
+# a per-test list: it's allocated once, immutable, and hashable, so it
+# can be fed straight to the lru_cache shims as a cache key (CPython
+# caches the tuple's hash after the first computation).
+TEST_SKILLS: tuple = ("python", "pandas", "matplotlib", "sql")
+
+@pytest.fixture
+def test_skills():
+    """The shared skill tuple used across recommender tests."""
+    return TEST_SKILLS
@@ -0,0 +1,38 @@
+"""
+Beginner-Path Integration Test
+
+Exercises the full beginner flow — parser through recommender — in one
+place. This lives apart from the pure-parser tests so routine parser CI
+runs never pull in the recommender's heavier initialization; it is
+marked slow and excluded by the default addopts (-m "not slow"). Run it
+explicitly with:
+
+$ python -m pytest -m slow
+
+Author: Anslem Akadu
+"""
+
+import pytest
+
+pytestmark = pytest.mark.slow
+
+def test_beginner_end_to_end():
+    """A complete beginner gets a parsed input and a phased plan."""
+    from app.parser import parse_user_input
+    from app.recommender import analyze_career_transition
+
+    parsed = parse_user_input(
+        target_role="data_scientist",
+        transition_type="beginner",
+    )
+    assert parsed["skills"] == []
+    assert parsed["current_role"] == "entry_level"
+
+    analysis = analyze_career_transition(
+        user_skills=parsed["skills"],
+        current_role_slug="none",
+        target_role_slug="data_scientist",
+        transition_type="beginner",
+    )
+    assert analysis["phases"]
+    assert analysis["missing_skills"]
@@ -0,0 +1,71 @@
+"""
+Performance Benchmarks
+
+Regression guards for the parser and recommender hot paths (TODO #4 in
+both unit-test files). Requires pytest-benchmark; the whole module is
+skipped when it isn't installed, so the plugin stays an optional dev
+dependency (see the commented extra in requirements.txt). Benchmarks
+are also marked slow and excluded from the default run. pytest-benchmark
+refuses to time under parallel workers, so override the xdist addopts
+with -n0 rather than disabling the plugin (which would leave -n/--dist
+unparseable):
+
+$ pip install pytest-benchmark
+$ python -m pytest -m slow -n0 tests/test_benchmarks.py
+
+Each case records the skill count in extra_info so per-skill cost can
+be compared across runs with differently sized inputs.
+
+Author: Anslem Akadu
+"""
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+try:
+    from tests._cases import CASES, CASE_IDS
+    from tests.conftest import TEST_SKILLS
+except ImportError:
+    # pytest imports this file with tests/ itself on sys.path
+    from _cases import CASES, CASE_IDS
+    from conftest import TEST_SKILLS
+
+pytestmark = pytest.mark.slow
+
+@pytest.mark.parametrize("case", CASES, ids=CASE_IDS)
+def test_parser_bench(benchmark, case):
+    """Benchmark parse_user_input across the shared scenario matrix."""
+    from app.parser import parse_user_input
+
+    benchmark.extra_info["n_skills"] = max(1, len(case.skills))
+    result = benchmark.pedantic(
+        parse_user_input,
+        kwargs=dict(
+            target_role=case.target,
+            current_role=case.current,
+            skills=case.skills_str,
+            transition_type=case.transition_type,
+        ),
+        iterations=50,
+        rounds=20,
+    )
+    assert result["transition_type"] == case.transition_type
+
+def test_recommender_bench(benchmark):
+    """Benchmark a full transition analysis on the shared skill set."""
+    from app.recommender import analyze_career_transition
+
+    benchmark.extra_info["n_skills"] = len(TEST_SKILLS)
+    result = benchmark.pedantic(
+        analyze_career_transition,
+        kwargs=dict(
+            user_skills=list(TEST_SKILLS),
+            current_role_slug="data_scientist",
+            target_role_slug="ml_engineer",
+            transition_type="upskill",
+        ),
+        iterations=20,
+        rounds=10,
+    )
+    assert result["missing_skills"]
@@ -14,98 +14,114 @@ Test Coverage:
 - Different transition types
 
 How to run:
-$ python -m tests.test_parser
+$ python -m pytest tests/test_parser.py
 
 Author: Anslem Akadu
 """
 
+import functools
 import json
-import unittest
+import os
+
+import pytest
+
 from app.parser import parse_user_input
 
-class TestParser(unittest.TestCase):
-    """Test suite for the parser module's core functionality."""
-    
-    def test_career_transition(self):
-        """Test career transition scenario with existing skills."""
-        result = parse_user_input(
-            target_role="ml_engineer",
-            current_role="data_scientist",
-            skills="python, pandas, scikit-learn, sql",
-            transition_type="upskill"
-        )
-        self.assertIsNotNone(result)
-        self.assertEqual(result["transition_type"], "upskill")
-        self.assertIn("python", result["matched_skills"])
-    
-    def test_complete_beginner(self):
-        """Test complete beginner scenario with no prior skills."""
-        result = parse_user_input(
-            target_role="data_scientist",
-            transition_type="beginner"
-        )
-        self.assertIsNotNone(result)
-        self.assertEqual(result["transition_type"], "beginner")
-        self.assertEqual(len(result.get("matched_skills", [])), 0)
-    
-    def test_same_role_enhancement(self):
-        """Test skill enhancement within the same role."""
-        result = parse_user_input(
-            target_role="backend_engineer",
-            current_role="backend_engineer",
-            skills="python, flask, postgresql",
-            transition_type="same_role"
+try:
+    from tests._cases import CASES, CASE_IDS
+except ImportError:
+    # pytest imports this file with tests/ itself on sys.path
+    from _cases import CASES, CASE_IDS
+
+@pytest.fixture(scope="session")
+def parse_cached():
+    """
+    Session-memoized front for parse_user_input.
+
+    Repeated runs (and repeated param sets under -n auto reruns) hit the
+    same argument tuples; parsing is pure, so one call per unique tuple
+    per session is enough. Tests must treat the returned dict as
+    read-only — it is shared between cache hits.
+    """
+    @functools.lru_cache(maxsize=None)
+    def _parse(target_role, current_role, skills, transition_type):
+        return parse_user_input(
+            target_role=target_role,
+            current_role=current_role,
+            skills=skills,
+            transition_type=transition_type,
         )
-        self.assertIsNotNone(result)
-        self.assertEqual(result["transition_type"], "same_role")
-        self.assertIn("python", result["matched_skills"])
+    return _parse
+
+# One parametrized test instead of three near-identical methods: pytest
+# reuses a single function and setup pass across the shared scenario
+# matrix in tests/_cases.py.
+@pytest.mark.parametrize("case", CASES, ids=CASE_IDS)
+def test_parse_user_input(parse_cached, case):
+    """Parse each transition scenario and check the normalized output."""
+    result = parse_cached(case.target, case.current, case.skills_str, case.transition_type)
+    assert result is not None
+    assert result["transition_type"] == case.transition_type
+    assert result["target_role"] == case.target
+    # Membership checks go through a frozenset: O(1) per assertion
+    # instead of a linear scan of the returned list
+    skills = frozenset(result["skills"])
+    if case.expect_skill is not None:
+        assert case.expect_skill in skills
+    else:
+        # Beginners start with no skills
+        assert not skills
+
+def _report(result):
+    """
+    One-line summary per manual case; the full indent=2 JSON walk of the
+    result only runs when ELEVATR_VERBOSE is set.
+    """
+    if os.environ.get("ELEVATR_VERBOSE"):
+        print(json.dumps(result, indent=2))
+    else:
+        print(f"ok: transition_type={result['transition_type']}, skills={len(result['skills'])}")
 
 # Manual testing functionality
+def run_manual_tests():
+    """Run manual tests with detailed output for development."""
+    print("=== Manual Parser Testing ===\n")
+
+    # Test 1: Career transition with skills
+    print("Testing: Career Transition")
+    test1 = parse_user_input(
+        target_role="ml_engineer",
+        current_role="data_scientist",
+        skills="python, pandas, scikit-learn, sql",
+        transition_type="upskill"
+    )
+    _report(test1)
+    print("\n" + "="*50 + "\n")
+
+    # The beginner walkthrough moved to tests/test_beginner_integration.py
+    # (marked slow) so this file stays a pure-parser exercise.
+
+    # Test 2: Same role enhancement
+    print("Testing: Same Role Enhancement")
+    test3 = parse_user_input(
+        target_role="backend_engineer",
+        current_role="backend_engineer",
+        skills="python, flask, postgresql",
+        transition_type="same_role"
+    )
+    _report(test3)
+
 if __name__ == "__main__":
-    # For quick manual testing during development
-    def run_manual_tests():
-        """Run manual tests with detailed output for development."""
-        print("=== Manual Parser Testing ===\n")
-        
-        # Test 1: Career transition with skills
-        print("Testing: Career Transition")
-        test1 = parse_user_input(
-            target_role="ml_engineer",
-            current_role="data_scientist",
-            skills="python, pandas, scikit-learn, sql",
-            transition_type="upskill"
-        )
-        print(json.dumps(test1, indent=2))
-        print("\n" + "="*50 + "\n")
-        
-        # Test 2: Complete beginner
-        print("Testing: Complete Beginner")
-        test2 = parse_user_input(
-            target_role="data_scientist",
-            transition_type="beginner"
-        )
-        print(json.dumps(test2, indent=2))
-        print("\n" + "="*50 + "\n")
-        
-        # Test 3: Same role enhancement
-        print("Testing: Same Role Enhancement")
-        test3 = parse_user_input(
-            target_role="backend_engineer",
-            current_role="backend_engineer",
-            skills="python, flask, postgresql",
-            transition_type="same_role"
-        )
-        print(json.dumps(test3, indent=2))
-    
-    # Run both unit tests and manual tests
-    print("Running unit tests...")
-    unittest.main(argv=[''], exit=False)
-    print("\nRunning manual tests...")
-    run_manual_tests()
+    # The manual tests re-run the same scenarios the unit tests cover;
+    # opt in with ELEVATR_MANUAL=1 instead of always running both
+    if os.environ.get("ELEVATR_MANUAL"):
+        run_manual_tests()
+    else:
+        pytest.main([__file__, "-q"])
 
 # TODO: Future Test Improvements
 # 1. Add edge case testing (invalid roles, empty skills)
 # 2. Add property-based testing for input validation
 # 3. Add integration tests with the ML pipeline
 # 4. Add performance benchmarks
-# 5. Add test coverage reporting
\ No newline at end of file
+# 5. Add test coverage reporting